@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import heapq
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, List, Sequence, Tuple
 
 Graph = Dict[str, Dict[str, float]]
+# Each edge carries its distance and a per-minute delay table covering one day
+# (DAY_MINUTES + 1 samples, the last one repeating the first).
+TimeDependentGraph = Dict[str, Dict[str, Tuple[float, Sequence[float]]]]
+
+DAY_MINUTES = 1440
+# Cruising speed used to turn road distance into driving minutes for the
+# time-dependent search; at 60 km/h one km takes one minute.
+AVERAGE_SPEED_KMH = 60.0
 
 
 def reconstruct_path(came_from: Dict[str, str], start: str, goal: str) -> List[str]:
@@ -80,3 +88,89 @@ def astar(
 
     path = reconstruct_path(came_from, start, goal)
     return path, g_score[goal], explored_count
+
+
+def profile_delay(delays: Sequence[float], time: float) -> float:
+    minute = time % DAY_MINUTES
+    # Float modulo can round tiny negative times up to exactly DAY_MINUTES.
+    index = min(int(minute), DAY_MINUTES - 1)
+    lower = delays[index]
+    return lower + (delays[index + 1] - lower) * (minute - index)
+
+
+def time_dependent_dijkstra(
+    graph: TimeDependentGraph,
+    start: str,
+    goal: str,
+    departure_time: float,
+    speed_kmh: float = AVERAGE_SPEED_KMH,
+) -> Tuple[List[str], float, int]:
+    minutes_per_km = 60.0 / speed_kmh
+    elapsed = {node: float("inf") for node in graph}
+    elapsed[start] = 0.0
+    came_from: Dict[str, str] = {}
+
+    queue: List[Tuple[float, str]] = [(0.0, start)]
+    explored_count = 0
+
+    while queue:
+        current_elapsed, current = heapq.heappop(queue)
+        if current_elapsed > elapsed[current]:
+            continue
+
+        explored_count += 1
+
+        if current == goal:
+            break
+
+        # Profiles are FIFO, so leaving on arrival is never worse than waiting.
+        arrival_time = departure_time + current_elapsed
+        for neighbor, (distance, delays) in graph[current].items():
+            new_elapsed = current_elapsed + distance * minutes_per_km + profile_delay(delays, arrival_time)
+            if new_elapsed < elapsed[neighbor]:
+                elapsed[neighbor] = new_elapsed
+                came_from[neighbor] = current
+                heapq.heappush(queue, (new_elapsed, neighbor))
+
+    path = reconstruct_path(came_from, start, goal)
+    return path, elapsed[goal], explored_count
+
+
+def time_dependent_astar(
+    graph: TimeDependentGraph,
+    start: str,
+    goal: str,
+    departure_time: float,
+    heuristic: Callable[[str, str], float],
+    speed_kmh: float = AVERAGE_SPEED_KMH,
+) -> Tuple[List[str], float, int]:
+    # The heuristic is a distance in km; at the same speed it bounds travel minutes.
+    minutes_per_km = 60.0 / speed_kmh
+    g_score = {node: float("inf") for node in graph}
+    g_score[start] = 0.0
+
+    came_from: Dict[str, str] = {}
+    open_queue: List[Tuple[float, float, str]] = [(heuristic(start, goal) * minutes_per_km, 0.0, start)]
+    explored_count = 0
+
+    while open_queue:
+        _, current_g, current = heapq.heappop(open_queue)
+        if current_g > g_score[current]:
+            continue
+
+        explored_count += 1
+
+        if current == goal:
+            break
+
+        arrival_time = departure_time + current_g
+        for neighbor, (distance, delays) in graph[current].items():
+            tentative_g = current_g + distance * minutes_per_km + profile_delay(delays, arrival_time)
+            if tentative_g < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                f_score = tentative_g + heuristic(neighbor, goal) * minutes_per_km
+                heapq.heappush(open_queue, (f_score, tentative_g, neighbor))
+
+    path = reconstruct_path(came_from, start, goal)
+    return path, g_score[goal], explored_count
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import time
 from pathlib import Path
 
 import streamlit as st
@@ -25,7 +26,13 @@ with tab1:
         start_city = st.selectbox("Start City", options=cities, index=0, key="demo_start")
         default_goal_index = len(cities) - 1 if len(cities) > 1 else 0
         goal_city = st.selectbox("Destination City", options=cities, index=default_goal_index, key="demo_goal")
-        simulate_traffic = st.checkbox("Simulate Real-Time Traffic", value=True)
+        traffic_mode = st.radio(
+            "Traffic Model",
+            options=["Static", "Simulate Real-Time Traffic", "Time-of-Day Profiles"],
+            index=1,
+            horizontal=True,
+        )
+        departure = st.time_input("Departure Time (Time-of-Day Profiles)", value=time(8, 30), key="demo_departure")
         submitted = st.form_submit_button("Find Route")
 
     if submitted:
@@ -36,8 +43,9 @@ with tab1:
             result = run_route_planner(
                 start=start_city,
                 goal=goal_city,
-                simulate_traffic=simulate_traffic,
+                simulate_traffic=traffic_mode == "Simulate Real-Time Traffic",
                 map_output_file=map_file,
+                departure_time=departure.hour * 60 + departure.minute if traffic_mode == "Time-of-Day Profiles" else None,
             )
 
             dijkstra_data = result["dijkstra"]
@@ -45,8 +53,9 @@ with tab1:
 
             st.subheader("Results")
             col1, col2, col3 = st.columns(3)
-            col1.metric("Dijkstra Cost", f"{dijkstra_data['cost']:.2f}")
-            col2.metric("A* Cost", f"{astar_data['cost']:.2f}")
+            cost_unit = " (min)" if result["departure_time"] is not None else ""
+            col1.metric(f"Dijkstra Cost{cost_unit}", f"{dijkstra_data['cost']:.2f}")
+            col2.metric(f"A* Cost{cost_unit}", f"{astar_data['cost']:.2f}")
             col3.metric("A* Node Savings", dijkstra_data["visited"] - astar_data["visited"])
 
             st.write("**Dijkstra Path**", " -> ".join(dijkstra_data["path"]) if dijkstra_data["path"] else "No route found")
@@ -4,12 +4,21 @@ import argparse
 import json
 import math
 import random
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import folium
+import numpy as np
 
-from algorithms import astar, dijkstra
+from algorithms import (
+    DAY_MINUTES,
+    TimeDependentGraph,
+    astar,
+    dijkstra,
+    time_dependent_astar,
+    time_dependent_dijkstra,
+)
 
 
 BASE_DIR = Path(__file__).parent
@@ -46,6 +55,50 @@ def build_adjacency(roads: List[dict]) -> Dict[str, Dict[str, float]]:
     return graph
 
 
+def read_delay_profile(road: dict) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    profile = road.get("delay_profile")
+    if profile is None:
+        return (0.0,), (float(road["traffic_delay"]),)
+
+    minutes = np.asarray(profile["minutes"], dtype=float)
+    delays = np.asarray(profile["delays"], dtype=float)
+    name = f"{road['from']} -> {road['to']}"
+
+    if minutes.size == 0 or minutes.shape != delays.shape:
+        raise ValueError(f"Delay profile for {name} needs matching, non-empty minutes and delays")
+    if minutes[0] < 0 or minutes[-1] >= DAY_MINUTES or np.any(np.diff(minutes) <= 0):
+        raise ValueError(f"Delay profile minutes for {name} must increase within [0, {DAY_MINUTES})")
+    if np.any(delays < 0):
+        raise ValueError(f"Delay profile for {name} has negative delays")
+
+    # FIFO: a delay may not drop faster than the clock advances, otherwise
+    # leaving later could mean arriving earlier. The last segment wraps to the next day.
+    spans = np.diff(np.append(minutes, minutes[0] + DAY_MINUTES))
+    changes = np.diff(np.append(delays, delays[0]))
+    if np.any(changes < -spans):
+        raise ValueError(f"Delay profile for {name} violates FIFO (delay falls faster than time passes)")
+
+    return tuple(minutes.tolist()), tuple(delays.tolist())
+
+
+@lru_cache(maxsize=None)
+def build_delay_table(minutes: Tuple[float, ...], delays: Tuple[float, ...]) -> Tuple[float, ...]:
+    grid = np.arange(DAY_MINUTES + 1, dtype=float)
+    return tuple(np.interp(grid, minutes, delays, period=DAY_MINUTES).tolist())
+
+
+def build_time_dependent_adjacency(roads: List[dict]) -> TimeDependentGraph:
+    graph: TimeDependentGraph = {}
+    for road in roads:
+        source = road["from"]
+        target = road["to"]
+        edge = (float(road["distance"]), build_delay_table(*read_delay_profile(road)))
+
+        graph.setdefault(source, {})[target] = edge
+        graph.setdefault(target, {})[source] = edge
+    return graph
+
+
 def haversine_km(city_a: Tuple[float, float], city_b: Tuple[float, float]) -> float:
     lat1, lon1 = city_a
     lat2, lon2 = city_b
@@ -110,6 +163,7 @@ def run_route_planner(
     goal: str,
     simulate_traffic: bool = False,
     map_output_file: Path = OUTPUT_MAP,
+    departure_time: Optional[float] = None,
 ) -> dict:
     data = load_graph_data(DATA_FILE)
     cities = data["cities"]
@@ -117,6 +171,12 @@ def run_route_planner(
 
     city_lookup = build_city_lookup(cities)
 
+    if departure_time is not None and not 0 <= departure_time < DAY_MINUTES:
+        raise ValueError(f"Departure time must be within [0, {DAY_MINUTES}) minutes after midnight")
+
+    if simulate_traffic and departure_time is not None:
+        raise ValueError("Traffic simulation and departure time cannot be combined")
+
     if simulate_traffic:
         update_traffic_delays(roads)
 
@@ -124,17 +184,23 @@ def run_route_planner(
         valid = ", ".join(sorted(city_lookup.keys()))
         raise ValueError(f"Invalid city. Choose from: {valid}")
 
-    graph = build_adjacency(roads)
     heuristic = make_heuristic(city_lookup)
 
-    d_path, d_cost, d_visited = dijkstra(graph, start, goal)
-    a_path, a_cost, a_visited = astar(graph, start, goal, heuristic)
+    if departure_time is None:
+        graph = build_adjacency(roads)
+        d_path, d_cost, d_visited = dijkstra(graph, start, goal)
+        a_path, a_cost, a_visited = astar(graph, start, goal, heuristic)
+    else:
+        td_graph = build_time_dependent_adjacency(roads)
+        d_path, d_cost, d_visited = time_dependent_dijkstra(td_graph, start, goal, departure_time)
+        a_path, a_cost, a_visited = time_dependent_astar(td_graph, start, goal, departure_time, heuristic)
 
     create_map(city_lookup, d_path, a_path, map_output_file)
 
     return {
         "start": start,
         "goal": goal,
+        "departure_time": departure_time,
         "dijkstra": {"path": d_path, "cost": d_cost, "visited": d_visited},
         "astar": {"path": a_path, "cost": a_cost, "visited": a_visited},
         "map_file": str(map_output_file),
@@ -142,15 +208,33 @@ def run_route_planner(
     }
 
 
+def parse_departure_time(value: str) -> float:
+    message = f"Invalid departure time '{value}', expected HH:MM"
+    try:
+        hours, minutes = (int(part) for part in value.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(message) from None
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise argparse.ArgumentTypeError(message)
+    return float(hours * 60 + minutes)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Smart Route Planner: Dijkstra vs A*")
     parser.add_argument("--start", default="Delhi", help="Start city")
     parser.add_argument("--goal", default="Varanasi", help="Destination city")
-    parser.add_argument(
+    traffic_mode = parser.add_mutually_exclusive_group()
+    traffic_mode.add_argument(
         "--simulate-traffic",
         action="store_true",
         help="Randomly update traffic delays before route calculation",
     )
+    traffic_mode.add_argument(
+        "--depart",
+        type=parse_departure_time,
+        default=None,
+        help="Departure time (HH:MM) for time-of-day traffic profiles",
+    )
     return parser.parse_args()
 
 
@@ -161,6 +245,7 @@ def main() -> None:
         goal=args.goal,
         simulate_traffic=args.simulate_traffic,
         map_output_file=OUTPUT_MAP,
+        departure_time=args.depart,
     )
 
     d_path = result["dijkstra"]["path"]
@@ -170,17 +255,21 @@ def main() -> None:
     a_cost = result["astar"]["cost"]
     a_visited = result["astar"]["visited"]
 
+    cost_label = "Total Cost (Distance + Traffic)" if args.depart is None else "Travel Time (minutes)"
+
     print("\n=== Smart Route Planner ===")
     print(f"From: {args.start} -> To: {args.goal}")
+    if args.depart is not None:
+        print(f"Departure: {int(args.depart) // 60:02d}:{int(args.depart) % 60:02d}")
 
     print("\n[Dijkstra]")
     print(f"Path: {' -> '.join(d_path) if d_path else 'No route found'}")
-    print(f"Total Cost (Distance + Traffic): {d_cost:.2f}")
+    print(f"{cost_label}: {d_cost:.2f}")
     print(f"Visited Nodes: {d_visited}")
 
     print("\n[A*]")
     print(f"Path: {' -> '.join(a_path) if a_path else 'No route found'}")
-    print(f"Total Cost (Distance + Traffic): {a_cost:.2f}")
+    print(f"{cost_label}: {a_cost:.2f}")
     print(f"Visited Nodes: {a_visited}")
 
     print("\n[Comparison]")
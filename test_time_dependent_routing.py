@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from algorithms import DAY_MINUTES, astar, dijkstra, profile_delay, time_dependent_astar, time_dependent_dijkstra
+from main import (
+    DATA_FILE,
+    build_adjacency,
+    build_city_lookup,
+    build_delay_table,
+    build_time_dependent_adjacency,
+    load_graph_data,
+    make_heuristic,
+    read_delay_profile,
+)
+
+
+def make_road(source: str, target: str, distance: float, minutes: list, delays: list) -> dict:
+    return {
+        "from": source,
+        "to": target,
+        "distance": distance,
+        "traffic_delay": delays[0],
+        "delay_profile": {"minutes": minutes, "delays": delays},
+    }
+
+
+def test_steep_drop_is_rejected():
+    road = make_road("A", "B", 10, [0, 10], [50, 10])
+    with pytest.raises(ValueError, match="FIFO"):
+        read_delay_profile(road)
+
+
+def test_steep_drop_across_midnight_is_rejected():
+    # The wrap segment runs from 1400 back to 0 the next day: 100 -> 0 in 40 minutes.
+    road = make_road("A", "B", 10, [0, 1400], [0, 100])
+    with pytest.raises(ValueError, match="FIFO"):
+        read_delay_profile(road)
+
+
+def test_drop_matching_clock_is_accepted():
+    road = make_road("A", "B", 10, [0, 100], [100, 0])
+    assert read_delay_profile(road) == ((0.0, 100.0), (100.0, 0.0))
+
+
+def test_profile_delay_matches_interp():
+    minutes = (0.0, 360.0, 510.0, 660.0, 1050.0, 1200.0, 1380.0)
+    delays = (12.0, 20.0, 40.0, 25.0, 45.0, 25.0, 15.0)
+    table = build_delay_table(minutes, delays)
+
+    times = list(minutes) + [0.5, 123.25, 509.9, 1000.0, 1439.75, 1440.0 + 600.5]
+    for time in times:
+        expected = np.interp(time, minutes, delays, period=DAY_MINUTES)
+        assert profile_delay(table, time) == pytest.approx(expected)
+
+
+def test_profile_delay_handles_tiny_negative_time():
+    table = build_delay_table((0.0, 600.0), (10.0, 20.0))
+    assert profile_delay(table, -1e-20) == pytest.approx(10.0)
+
+
+def test_constant_profiles_match_static_search():
+    data = load_graph_data(DATA_FILE)
+    roads = [{key: value for key, value in road.items() if key != "delay_profile"} for road in data["roads"]]
+    heuristic = make_heuristic(build_city_lookup(data["cities"]))
+
+    static_graph = build_adjacency(roads)
+    td_graph = build_time_dependent_adjacency(roads)
+
+    static_result = dijkstra(static_graph, "Delhi", "Varanasi")
+    assert static_result[1] == pytest.approx(965.0)
+
+    for departure_time in (0.0, 510.0, 1439.0):
+        path, cost, _ = time_dependent_dijkstra(td_graph, "Delhi", "Varanasi", departure_time)
+        assert (path, cost) == (static_result[0], pytest.approx(static_result[1]))
+
+        path, cost, _ = time_dependent_astar(td_graph, "Delhi", "Varanasi", departure_time, heuristic)
+        static_path, static_cost, _ = astar(static_graph, "Delhi", "Varanasi", heuristic)
+        assert (path, cost) == (static_path, pytest.approx(static_cost))
+
+
+def test_departure_before_midnight_wraps():
+    roads = [
+        make_road("A", "B", 2, [0], [0]),
+        make_road("B", "C", 30, [0, 600], [100, 40]),
+    ]
+    graph = build_time_dependent_adjacency(roads)
+
+    # Leaving at 23:59 and driving 2 km at 60 km/h reaches B at 00:01 the next day.
+    path, cost, _ = time_dependent_dijkstra(graph, "A", "C", 1439.0)
+    expected_delay = np.interp(1.0, [0, 600], [100, 40], period=DAY_MINUTES)
+    assert path == ["A", "B", "C"]
+    assert cost == pytest.approx(2 + 30 + expected_delay)
+
+
+def test_speed_scales_driving_time():
+    graph = build_time_dependent_adjacency([make_road("A", "B", 120, [0], [15])])
+    _, cost, _ = time_dependent_dijkstra(graph, "A", "B", 0.0, speed_kmh=120.0)
+    assert cost == pytest.approx(60 + 15)